@@ -1,17 +1,47 @@
 import os
 import sys
+import asyncio
+import hashlib
+import json
 import logging
 import requests
+import shutil
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from io import BytesIO
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
 from datetime import datetime
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image
-from reportlab.pdfgen import canvas
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image, IndexingFlowable
+from PIL import Image as PILImage
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Error types differ between the two HTTP stacks
+_HTTP_STATUS_ERRORS = (requests.exceptions.HTTPError,) + (
+    (httpx.HTTPStatusError,) if httpx else ())
+_REQUEST_ERRORS = (requests.exceptions.RequestException,) + (
+    (httpx.HTTPError,) if httpx else ())
 
 # Global logger variable
 logger = None
@@ -41,9 +71,17 @@ def setup_logging(output_dir):
     return logger
 
 class AuroraAPI:
-    def __init__(self, api_key, tenant_id, logger):
+    # Cached responses older than this are re-fetched
+    CACHE_TTL = 3600  # seconds
+
+    # Fail fast on dead endpoints instead of burning the full read timeout
+    REQUEST_TIMEOUT = (5, 30)  # connect, read
+
+    def __init__(self, api_key, tenant_id, logger, cache_ttl=None):
         self.api_key = api_key
         self.tenant_id = tenant_id
+        self.cache_dir = Path.home() / '.cache' / 'aurora'
+        self.cache_ttl = cache_ttl if cache_ttl is not None else self.CACHE_TTL
         self.base_url = "https://api.aurorasolar.com"
         self.headers = {
             'Authorization': f'Bearer {api_key}',
@@ -51,14 +89,75 @@ class AuroraAPI:
         }
         self.logger = logger
 
+        # Reuse one session so urllib3's pool keeps the HTTPS connection
+        # to api.aurorasolar.com alive across the sequential report calls
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(
+                total=3,
+                connect=3,
+                read=2,
+                status=3,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(['GET'])
+            )
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # With httpx (and its h2 extra) installed, multiplex everything over
+        # one HTTP/2 connection instead; the session above stays the fallback
+        self.client = None
+        if httpx is not None:
+            try:
+                self.client = httpx.Client(
+                    headers=self.headers,
+                    # requests follows redirects by default; httpx does not
+                    follow_redirects=True,
+                    timeout=httpx.Timeout(connect=5, read=30, write=10, pool=5),
+                    transport=httpx.HTTPTransport(
+                        retries=3,  # httpx only retries connects natively
+                        http2=True,
+                        limits=httpx.Limits(max_keepalive_connections=10, max_connections=20)
+                    )
+                )
+            except ImportError:
+                # httpx is installed without the http2 extra
+                self.logger.warning("httpx lacks HTTP/2 support; using requests")
+
+    # Status-retry parity with the session adapter's urllib3.Retry policy,
+    # which never runs when the httpx client handles a request
+    _RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    _CLIENT_RETRIES = 3
+    _CLIENT_BACKOFF = 0.5  # seconds, doubled per attempt
+
+    def _client_request(self, method, url, **kwargs):
+        """httpx request with exponential backoff on retryable statuses."""
+        response = None
+        for attempt in range(self._CLIENT_RETRIES + 1):
+            if attempt:
+                time.sleep(self._CLIENT_BACKOFF * (2 ** (attempt - 1)))
+            response = self.client.request(method, url, **kwargs)
+            if response.status_code not in self._RETRY_STATUSES:
+                break
+            if attempt < self._CLIENT_RETRIES:
+                response.close()
+        return response
+
+    def _get(self, url, **kwargs):
+        """GET via the HTTP/2 client when available, else the pooled session."""
+        if self.client is not None:
+            return self._client_request('GET', url, **kwargs)
+        return self.session.get(url, timeout=self.REQUEST_TIMEOUT, **kwargs)
+
     def validate_credentials(self):
         """Test API credentials and tenant ID."""
         try:
-            response = requests.get(
-                f"{self.base_url}/tenants/{self.tenant_id}",
-                headers=self.headers,
-                timeout=30
-            )
+            response = self._get(f"{self.base_url}/tenants/{self.tenant_id}")
             
             if response.status_code == 401:
                 self.logger.error("API authentication failed - check your API key")
@@ -76,42 +175,90 @@ class AuroraAPI:
             self.logger.error(f"Failed to validate credentials: {str(e)}")
             return False
 
+    def _cache_path(self, endpoint, method, params):
+        """Return the on-disk cache file for a request signature."""
+        key = repr((self.tenant_id, endpoint, method, sorted((params or {}).items())))
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+
+    def _cache_bypassed(self):
+        return os.environ.get('AURORA_CACHE_BYPASS') == '1'
+
+    def _read_cache(self, path):
+        """Load a cached payload if it exists and is fresh enough."""
+        try:
+            if time.time() - path.stat().st_mtime < self.cache_ttl:
+                raw = path.read_bytes()
+                return orjson.loads(raw) if orjson else json.loads(raw)
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def _write_cache(self, path, data):
+        """Write a payload atomically (tmp + rename) so readers never see partials."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            payload = orjson.dumps(data) if orjson else json.dumps(data).encode()
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError) as e:
+            self.logger.warning(f"Failed to cache response: {str(e)}")
+
     def _make_request(self, endpoint, method='GET', params=None):
-        """Make API request with enhanced debugging."""
+        """Make API request with enhanced debugging and on-disk caching."""
         url = f"{self.base_url}/tenants/{self.tenant_id}{endpoint}"
+
+        cache_path = self._cache_path(endpoint, method, params)
+        if not self._cache_bypassed():
+            cached = self._read_cache(cache_path)
+            if cached is not None:
+                self.logger.info(f"Serving {endpoint} from cache")
+                return cached
+
         try:
             self.logger.info(f"Making {method} request to: {url}")
-            self.logger.debug(f"Request headers: {self.headers}")
-            self.logger.debug(f"Request params: {params}")
+            # %s-style args so the formatting only runs when DEBUG is enabled
+            self.logger.debug("Request headers: %s", self.headers)
+            self.logger.debug("Request params: %s", params)
             
-            response = requests.request(
-                method, 
-                url, 
-                headers=self.headers, 
-                params=params, 
-                timeout=30
-            )
+            if self.client is not None:
+                response = self._client_request(method, url, params=params)
+            else:
+                response = self.session.request(
+                    method,
+                    url,
+                    params=params,
+                    timeout=self.REQUEST_TIMEOUT
+                )
             
-            self.logger.debug(f"Response status code: {response.status_code}")
-            self.logger.debug(f"Response headers: {response.headers}")
+            self.logger.debug("Response status code: %s", response.status_code)
+            self.logger.debug("Response headers: %s", response.headers)
             
             try:
                 response.raise_for_status()
-            except requests.exceptions.HTTPError as e:
+            except _HTTP_STATUS_ERRORS as e:
                 self.logger.error(f"HTTP Error: {str(e)}")
-                self.logger.error(f"Response body: {response.text}")
+                # Truncate: error bodies can be as large as any other response
+                self.logger.error("Response status %s, body: %s",
+                                  response.status_code, response.text[:1024])
                 return {}
                 
             try:
-                data = response.json()
-                self.logger.debug(f"Response data: {data}")
+                # orjson skips requests' charset detection on top of being faster
+                data = orjson.loads(response.content) if orjson else response.json()
+                self.logger.debug("Response data: %s", data)
+                self._write_cache(cache_path, data)
                 return data
             except ValueError as e:
                 self.logger.error(f"Invalid JSON in response: {str(e)}")
-                self.logger.error(f"Raw response: {response.text}")
+                # Decode only the first KiB; skips the full charset-detection
+                # pass response.text would run over the whole body
+                self.logger.error("Raw response: %s",
+                                  response.content[:1024].decode('utf-8', 'replace'))
                 return {}
                 
-        except requests.exceptions.RequestException as e:
+        except _REQUEST_ERRORS as e:
             self.logger.error(f"Request failed: {str(e)}")
             return {}
 
@@ -128,111 +275,359 @@ class AuroraAPI:
         data = self._make_request(f"/designs/{design_id}/pricing")
         return data.get('pricing', {})
 
+    # Images above this size are handed to ReportLab as files, not heap buffers
+    IMAGE_SPILL_THRESHOLD = 4 * 1024 * 1024  # bytes
+
+    def _image_cache_path(self, url):
+        return self.cache_dir / 'img' / f"{hashlib.sha1(url.encode()).hexdigest()}.bin"
+
+    def _cached_image(self, url, cache_path):
+        """Return a cached image buffer/path, or None on miss or bypass."""
+        if self._cache_bypassed():
+            return None
+        try:
+            if cache_path.is_file():
+                self.logger.info(f"Serving image from cache: {url}")
+                if cache_path.stat().st_size > self.IMAGE_SPILL_THRESHOLD:
+                    return str(cache_path)
+                return BytesIO(cache_path.read_bytes())
+        except OSError:
+            pass
+        return None
+
+    def _store_image(self, buf, cache_path):
+        """Cache downloaded image bytes and pick the return representation."""
+        size = buf.getbuffer().nbytes
+        self.logger.info(f"Successfully downloaded image ({size} bytes)")
+
+        cached = False
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(buf.getbuffer())
+            os.replace(tmp_path, cache_path)
+            cached = True
+        except OSError as e:
+            self.logger.warning(f"Failed to cache image: {str(e)}")
+
+        if size > self.IMAGE_SPILL_THRESHOLD:
+            # Hand ReportLab a filename so the pixels stay off the heap
+            if cached:
+                return str(cache_path)
+            with tempfile.NamedTemporaryFile(delete=False, suffix='.img') as spill:
+                spill.write(buf.getbuffer())
+            return spill.name
+
+        buf.seek(0)
+        return buf
+
     def download_image(self, url):
-        """Download image from URL with improved error handling and token management."""
+        """Download image from URL, returning a BytesIO or a filename for large images."""
+        # Image URLs are content-addressed S3 objects, so cache hits are safe
+        cache_path = self._image_cache_path(url)
+        cached = self._cached_image(url, cache_path)
+        if cached is not None:
+            return cached
+
         try:
             self.logger.info(f"Downloading image from: {url}")
-            
+
             # Handle different URL types
+            s3_url = url.startswith('https://aurora-user-data.s3.amazonaws.com')
+            if s3_url:
+                # Presigned S3 URLs carry their auth in the query string, and
+                # requests merges session headers into per-request ones - the
+                # None value drops Authorization from the merged set, so the
+                # bearer token is never disclosed to S3 (which would also
+                # reject a request with both auth mechanisms)
+                headers = {'Accept': 'image/*', 'Authorization': None}
+            else:
+                # For other URLs, use full API headers
+                headers = self.headers
+
+            # S3 downloads stay on the session: the httpx client would merge
+            # its default Authorization header into the request
+            if self.client is not None and not s3_url:
+                buf = None
+                for attempt in range(self._CLIENT_RETRIES + 1):
+                    if attempt:
+                        time.sleep(self._CLIENT_BACKOFF * (2 ** (attempt - 1)))
+                    with self.client.stream('GET', url, headers=headers) as response:
+                        # Retry 429/5xx with backoff, like the session adapter
+                        if (response.status_code in self._RETRY_STATUSES
+                                and attempt < self._CLIENT_RETRIES):
+                            continue
+                        response.raise_for_status()
+
+                        # Verify we received image data
+                        content_type = response.headers.get('content-type', '')
+                        if not content_type.startswith('image/'):
+                            self.logger.error(f"Received non-image content type: {content_type}")
+                            return None
+
+                        # Stream straight into one buffer so the bytes are never duplicated
+                        buf = BytesIO()
+                        for chunk in response.iter_bytes(64 * 1024):
+                            buf.write(chunk)
+                    if buf is not None:
+                        break
+            else:
+                with self.session.get(url, headers=headers, timeout=self.REQUEST_TIMEOUT, stream=True) as response:
+                    response.raise_for_status()
+
+                    # Verify we received image data
+                    content_type = response.headers.get('content-type', '')
+                    if not content_type.startswith('image/'):
+                        self.logger.error(f"Received non-image content type: {content_type}")
+                        return None
+
+                    # Stream straight into one buffer so the bytes are never duplicated
+                    buf = BytesIO()
+                    response.raw.decode_content = True
+                    shutil.copyfileobj(response.raw, buf, length=64 * 1024)
+
+            return self._store_image(buf, cache_path)
+
+        except Exception as e:
+            self.logger.error(f"Failed to download image: {str(e)}")
+            return None
+
+# Asset types that belong in the design-visualization section
+_LAYOUT_TYPES = frozenset({'layout_image'})
+_CAD_SCREENSHOT = 'CAD Screenshot'
+
+def _layout_assets(design_assets):
+    """Filter design assets down to layout images and CAD screenshots."""
+    return [
+        asset for asset in design_assets.get('assets', [])
+        if asset.get('type') in _LAYOUT_TYPES or asset.get('asset_type') == _CAD_SCREENSHOT
+    ]
+
+async def _noop():
+    return None
+
+class AuroraAPIAsync:
+    """Async counterpart of AuroraAPI so independent requests can overlap.
+
+    Used as an async context manager; requires aiohttp. Delegates the
+    on-disk response/image cache to the wrapped AuroraAPI so both paths
+    share one cache.
+    """
+    def __init__(self, api):
+        self.api = api
+        self.tenant_id = api.tenant_id
+        self.base_url = api.base_url
+        self.headers = api.headers
+        self.logger = api.logger
+        self._session = None
+
+    async def __aenter__(self):
+        # No default auth headers: aiohttp merges session headers into every
+        # request, and S3 downloads must not carry the bearer token. API
+        # calls pass self.headers explicitly instead.
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=10, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=30, connect=5)
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self._session.close()
+
+    async def _make_request(self, endpoint, params=None):
+        url = f"{self.base_url}/tenants/{self.tenant_id}{endpoint}"
+
+        cache_path = self.api._cache_path(endpoint, 'GET', params)
+        if not self.api._cache_bypassed():
+            cached = self.api._read_cache(cache_path)
+            if cached is not None:
+                self.logger.info(f"Serving {endpoint} from cache")
+                return cached
+
+        try:
+            self.logger.info(f"Making GET request to: {url}")
+            for attempt in range(self.api._CLIENT_RETRIES + 1):
+                if attempt:
+                    await asyncio.sleep(self.api._CLIENT_BACKOFF * (2 ** (attempt - 1)))
+                async with self._session.get(url, params=params, headers=self.headers) as response:
+                    # Retry transient statuses with backoff, matching the
+                    # urllib3 Retry policy on the other two stacks
+                    if (response.status in self.api._RETRY_STATUSES
+                            and attempt < self.api._CLIENT_RETRIES):
+                        continue
+                    response.raise_for_status()
+                    data = await response.json()
+                break
+            self.api._write_cache(cache_path, data)
+            return data
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            # An exceeded ClientTimeout raises TimeoutError, not ClientError;
+            # one slow endpoint must not fail the whole gather
+            self.logger.error(f"Request failed: {str(e)}")
+            return {}
+
+    async def get_project(self, project_id):
+        return await self._make_request(f"/projects/{project_id}")
+
+    async def get_design_summary(self, design_id):
+        return await self._make_request(f"/designs/{design_id}/summary")
+
+    async def get_design_assets(self, design_id):
+        return await self._make_request(f"/designs/{design_id}/assets")
+
+    async def get_design_pricing(self, design_id):
+        data = await self._make_request(f"/designs/{design_id}/pricing")
+        return data.get('pricing', {})
+
+    async def download_image(self, url):
+        cache_path = self.api._image_cache_path(url)
+        cached = self.api._cached_image(url, cache_path)
+        if cached is not None:
+            return cached
+
+        try:
+            self.logger.info(f"Downloading image from: {url}")
+
             if url.startswith('https://aurora-user-data.s3.amazonaws.com'):
-                # For S3 URLs, use standard headers
                 headers = {'Accept': 'image/*'}
             else:
-                # For other URLs, use full API headers
                 headers = self.headers
-            
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            
-            # Verify we received image data
-            content_type = response.headers.get('content-type', '')
-            if not content_type.startswith('image/'):
-                self.logger.error(f"Received non-image content type: {content_type}")
-                return None
-            
-            # Log successful download
-            self.logger.info(f"Successfully downloaded image ({len(response.content)} bytes)")
-            return BytesIO(response.content)
-            
+
+            async with self._session.get(url, headers=headers) as response:
+                response.raise_for_status()
+
+                content_type = response.headers.get('content-type', '')
+                if not content_type.startswith('image/'):
+                    self.logger.error(f"Received non-image content type: {content_type}")
+                    return None
+
+                # Stream into one buffer; _store_image handles the cache
+                # write and the >4 MB spill-to-file, same as the sync path
+                buf = BytesIO()
+                async for chunk in response.content.iter_chunked(64 * 1024):
+                    buf.write(chunk)
+
+            return self.api._store_image(buf, cache_path)
+
         except Exception as e:
             self.logger.error(f"Failed to download image: {str(e)}")
             return None
 
-class FooterCanvas(canvas.Canvas):
-    def __init__(self, *args, **kwargs):
-        canvas.Canvas.__init__(self, *args, **kwargs)
-        self.pages = []
-
-    def showPage(self):
-        self.pages.append(dict(self.__dict__))
-        self._startPage()
-
-    def save(self):
-        page_count = len(self.pages)
-        for page_num, page in enumerate(self.pages, 1):
-            self.__dict__.update(page)
-            self.draw_footer(page_num, page_count)
-            canvas.Canvas.showPage(self)
-        canvas.Canvas.save(self)
-
-    def draw_footer(self, page_num, page_count):
-        width = self._pagesize[0]
-        current_time = datetime.now().strftime("%B %d, %Y %I:%M %p")
-        page_info = f"Page {page_num} of {page_count}"
-        
-        self.setFont("Helvetica", 9)
-        self.drawString(72, 30, " SPARTAN HOME SERVICES " + current_time)
-        page_num_width = self.stringWidth(page_info, "Helvetica", 9)
-        self.drawString(width - 72 - page_num_width, 30, page_info)
+class _PageCountMarker(IndexingFlowable):
+    """Zero-size story tail that records the total page count.
+
+    multiBuild keeps laying the story out until this is satisfied: the
+    first pass records the count, the next renders footers with it.
+    """
+    def __init__(self):
+        self.total = 0
+        self._last_total = None
+        self._satisfied = 0
+
+    def wrap(self, availWidth, availHeight):
+        return (0, 0)
+
+    def draw(self):
+        self.total = self.canv.getPageNumber()
+
+    def afterBuild(self):
+        self._satisfied = self.total == self._last_total
+        self._last_total = self.total
+
+    def isSatisfied(self):
+        return self._satisfied
+
+def _build_styles():
+    """Build the report stylesheet once at import; styles are immutable."""
+    styles = getSampleStyleSheet()
+
+    styles.add(ParagraphStyle(
+        name='SpartanTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        spaceAfter=30,
+        textColor=colors.HexColor('#44A5DB'),
+        fontName='Helvetica-Bold'
+    ))
+
+    styles.add(ParagraphStyle(
+        name='ReportHeader',
+        parent=styles['Heading2'],
+        fontSize=18,
+        spaceAfter=20,
+        textColor=colors.black,
+        fontName='Helvetica-Bold'
+    ))
+
+    styles.add(ParagraphStyle(
+        name='CustomBody',
+        parent=styles['Normal'],
+        fontSize=12,
+        spaceAfter=12,
+        leading=14
+    ))
+
+    return styles
+
+_STYLES = _build_styles()
+
+@lru_cache(maxsize=8)
+def _table_style(header_bg='#44A5DB'):
+    """Default table style, cached since TableStyle is immutable once built."""
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(header_bg)),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 14),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+        ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 12),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('WORDWRAP', (0, 0), (-1, -1), True),
+        ('LEFTPADDING', (0, 0), (-1, -1), 6),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 6),
+        ('ROWHEIGHT', (0, 0), (-1, -1), 30),
+    ])
 
 class PDFGenerator:
     def __init__(self, filename, logger):
         self.filename = filename
         self.logger = logger
+        # Write through one large buffer instead of many small kernel writes
+        self._output = open(filename, 'wb', buffering=1 << 20)
         self.doc = SimpleDocTemplate(
-            filename,
+            self._output,
             pagesize=letter,
             rightMargin=72,
             leftMargin=72,
             topMargin=36,
-            bottomMargin=72
+            bottomMargin=72,
+            pageCompression=1,  # deflate content streams; tables compress well
+            invariant=1  # deterministic output for downstream caching/diffing
         )
-        self.styles = getSampleStyleSheet()
+        self.styles = _STYLES
         self.elements = []
-        
-        self.styles.add(ParagraphStyle(
-            name='SpartanTitle',
-            parent=self.styles['Heading1'],
-            fontSize=24,
-            spaceAfter=30,
-            textColor=colors.HexColor('#44A5DB'),
-            fontName='Helvetica-Bold'
-        ))
-        
-        self.styles.add(ParagraphStyle(
-            name='ReportHeader',
-            parent=self.styles['Heading2'],
-            fontSize=18,
-            spaceAfter=20,
-            textColor=colors.black,
-            fontName='Helvetica-Bold'
-        ))
-        
-        self.styles.add(ParagraphStyle(
-            name='CustomBody',
-            parent=self.styles['Normal'],
-            fontSize=12,
-            spaceAfter=12,
-            leading=14
-        ))
+        self._image_buffers = []
+        self._page_marker = _PageCountMarker()
+
+        # Footer pieces computed once per document
+        self._footer_stamp = datetime.now().strftime("%B %d, %Y %I:%M %p")
+        self._footer_left = " SPARTAN HOME SERVICES " + self._footer_stamp
+        self._info_widths = {}
 
     def add_logo(self, logo_path):
         try:
-            logo = Image(logo_path)
+            # One PIL probe for the aspect ratio; explicit size plus lazy=2
+            # means ReportLab only opens the file again at render time and
+            # drops the decoded pixels once the page is drawn
+            with PILImage.open(logo_path) as probe:
+                aspect = probe.height / float(probe.width)
             max_width = self.doc.width * 0.25
-            aspect = logo.imageHeight / float(logo.imageWidth)
-            logo.drawWidth = max_width
-            logo.drawHeight = max_width * aspect
+            logo = Image(logo_path, width=max_width, height=max_width * aspect, lazy=2)
             self.elements.append(logo)
             self.elements.append(Spacer(1, 0.25*inch))
             return True
@@ -259,50 +654,76 @@ class PDFGenerator:
             
         table = Table(data, colWidths=col_widths)
         if style is None:
-            style = TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#44A5DB')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 14),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-                ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 1), (-1, -1), 12),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('WORDWRAP', (0, 0), (-1, -1), True),
-                ('LEFTPADDING', (0, 0), (-1, -1), 6),
-                ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-                ('ROWHEIGHT', (0, 0), (-1, -1), 30),
-            ])
+            style = _table_style()
         table.setStyle(style)
         self.elements.append(table)
         self.elements.append(Spacer(1, 0.25*inch))
 
+    # Raster resolution to embed images at; matches print quality at display size
+    EMBED_DPI = 150
+
+    def _downscale_image(self, image_data, max_width, max_height):
+        """Downscale an image to the display resolution before embedding.
+
+        Returns (buffer_or_path, pixel_width, pixel_height). Full-resolution
+        CAD screenshots get rendered at ~6 inches wide, so embedding them
+        as-is only bloats the PDF and slows the build.
+        """
+        if hasattr(image_data, 'seek'):
+            # Buffers may be reused when assets share a URL
+            image_data.seek(0)
+        pil_img = PILImage.open(image_data)
+        target = (int(max_width / inch * self.EMBED_DPI),
+                  int(max_height / inch * self.EMBED_DPI))
+
+        if pil_img.width <= target[0] and pil_img.height <= target[1]:
+            # Already at or below display resolution; embed unchanged
+            if hasattr(image_data, 'seek'):
+                image_data.seek(0)
+            return image_data, pil_img.width, pil_img.height
+
+        source_format = pil_img.format
+        pil_img.thumbnail(target, PILImage.Resampling.LANCZOS)
+
+        buf = BytesIO()
+        if source_format == 'PNG':
+            # Keep line-art CAD screenshots crisp
+            pil_img.save(buf, format='PNG', optimize=True)
+        else:
+            if pil_img.mode not in ('RGB', 'L'):
+                pil_img = pil_img.convert('RGB')
+            pil_img.save(buf, format='JPEG', quality=85)
+        buf.seek(0)
+        return buf, pil_img.width, pil_img.height
+
     def add_image(self, image_data, width_percentage=0.8):
         """Add an image to the PDF with proper scaling."""
         try:
             if image_data:
-                img = Image(image_data)
-                
                 # Calculate dimensions while maintaining aspect ratio
                 max_width = self.doc.width * width_percentage
-                aspect = img.imageHeight / float(img.imageWidth)
-                
+
                 # Set maximum height to 6 inches to prevent oversized images
                 max_height = 6 * inch
-                
+
+                image_data, px_width, px_height = self._downscale_image(
+                    image_data, max_width, max_height)
+                aspect = px_height / float(px_width)
+
                 # Calculate dimensions
-                img.drawWidth = max_width
-                img.drawHeight = max_width * aspect
-                
+                draw_width = max_width
+                draw_height = max_width * aspect
+
                 # If height exceeds max, scale down proportionally
-                if img.drawHeight > max_height:
-                    img.drawHeight = max_height
-                    img.drawWidth = max_height / aspect
-                
+                if draw_height > max_height:
+                    draw_height = max_height
+                    draw_width = max_height / aspect
+
+                # Explicit size so ReportLab skips its own size probe; lazy=2
+                # keeps at most one image decoded at a time during the build
+                img = Image(image_data, width=draw_width, height=draw_height, lazy=2)
+                if hasattr(image_data, 'close'):
+                    self._image_buffers.append(image_data)
                 self.elements.append(img)
                 self.elements.append(Spacer(1, 0.25*inch))
                 return True
@@ -310,13 +731,123 @@ class PDFGenerator:
             self.logger.error(f"Error adding image to PDF: {str(e)}")
         return False
 
+    def _draw_footer(self, canv, doc):
+        page_info = f"Page {canv.getPageNumber()} of {self._page_marker.total}"
+
+        canv.saveState()
+        canv.setFont("Helvetica", 9)
+        canv.drawString(72, 30, self._footer_left)
+
+        # Helvetica digits share one advance width, so caching the measured
+        # width by string length only misses when a digit count changes
+        info_width = self._info_widths.get(len(page_info))
+        if info_width is None:
+            info_width = canv.stringWidth(page_info, "Helvetica", 9)
+            self._info_widths[len(page_info)] = info_width
+
+        canv.drawString(doc.pagesize[0] - 72 - info_width, 30, page_info)
+        canv.restoreState()
+
     def generate(self):
         try:
-            self.doc.build(self.elements, canvasmaker=FooterCanvas)
+            self.elements.append(self._page_marker)
+            self.doc.multiBuild(
+                self.elements,
+                onFirstPage=self._draw_footer,
+                onLaterPages=self._draw_footer
+            )
             return True
         except Exception as e:
             self.logger.error(f"Error generating PDF: {e}")
             return False
+        finally:
+            self._release_resources()
+
+    def _release_resources(self):
+        """Drop built flowables and close image buffers so they can be GC'd."""
+        for buf in self._image_buffers:
+            try:
+                buf.close()
+            except Exception:
+                pass
+        del self._image_buffers[:]
+        del self.elements[:]
+        try:
+            self._output.close()
+        except OSError as e:
+            self.logger.error(f"Error closing PDF file: {e}")
+
+def _dig(data, path):
+    """Walk a dotted key path through nested dicts, returning '' when absent."""
+    for key in path.split('.'):
+        data = data.get(key, {}) if isinstance(data, dict) else {}
+    return '' if isinstance(data, dict) else data
+
+def _or_na(value):
+    return value or 'N/A'
+
+def _title_or_na(value):
+    return value.title() if value else 'N/A'
+
+def _join_name(first, last):
+    return f"{first} {last}".strip() or 'N/A'
+
+def _format_created(value):
+    try:
+        created_dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        return created_dt.strftime('%B %d, %Y')
+    except (AttributeError, TypeError, ValueError):
+        # Non-string payloads (None, numbers) fall back like bad dates do
+        return value or 'N/A'
+
+# (label, source key paths, formatter) specs compiled once at import, so the
+# table builders are a single loop instead of dozens of ad-hoc lookups
+_ADDRESS = 'location.property_address_components'
+_OVERVIEW_FIELDS = (
+    ('Project Name', ('name',), _or_na),
+    ('Customer Name', ('customer_first_name', 'customer_last_name'), _join_name),
+    ('Street Address', (f'{_ADDRESS}.street_address',), _or_na),
+    ('City', (f'{_ADDRESS}.city',), _or_na),
+    ('State', (f'{_ADDRESS}.region',), _or_na),
+    ('ZIP Code', (f'{_ADDRESS}.postal_code',), _or_na),
+    ('Created Date', ('created_at',), _format_created),
+    ('Status', ('status',), _title_or_na),
+    ('Property Type', ('project_type',), _title_or_na),
+)
+
+_DESIGN_FIELDS = (
+    ('System Size', lambda ctx: f"{ctx['system_size']:.2f} kW"),
+    ('Annual Production', lambda ctx: f"{ctx['annual_production']:,.0f} kWh"),
+    ('Number of Panels', lambda ctx: str(ctx['modules'].get('quantity', 'N/A'))),
+    ('Panel Model', lambda ctx: ctx['modules'].get('name', 'N/A')),
+    ('Inverter Model', lambda ctx: ctx['inverters'].get('name', 'N/A')),
+    ('Solar Access', lambda ctx: f"{ctx['solar_access']:.1f}%" if ctx['solar_access'] else 'N/A'),
+)
+
+_FINANCIAL_FIELDS = (
+    ('System Price', lambda ctx: f"${ctx['price']:,.2f}"),
+    ('Price per Watt', lambda ctx: f"${ctx['price']/(ctx['system_size']*1000):,.2f}/W"
+        if ctx['system_size'] > 0 else 'N/A'),
+    ('Federal Tax Credit', lambda ctx: f"${ctx['price']*0.30:,.2f}"),
+    ('Net System Cost', lambda ctx: f"${ctx['price']*0.70:,.2f}"),
+)
+
+def _format_overview_rows(project):
+    return [
+        [label, fmt(*(_dig(project, path) for path in paths))]
+        for label, paths, fmt in _OVERVIEW_FIELDS
+    ]
+
+@lru_cache(maxsize=128)
+def _cached_overview_rows(project_key):
+    """Format rows for a serialised project dict.
+
+    Batch runs generate many design reports against the same project, so
+    keying on the sorted JSON lets every report after the first skip the
+    formatting entirely.
+    """
+    project = orjson.loads(project_key) if orjson else json.loads(project_key)
+    return _format_overview_rows(project)
 
 class AuroraSolarReport:
     def __init__(self, api_key, tenant_id, output_dir, logger, logo_path=None):
@@ -328,31 +859,40 @@ class AuroraSolarReport:
     def format_project_overview(self, project_data):
         if not project_data or 'project' not in project_data:
             return None
-                
+
         project = project_data['project']
-        location = project.get('location', {})
-        address_components = location.get('property_address_components', {})
-        
         try:
-            created_dt = datetime.fromisoformat(project.get('created_at', '').replace('Z', '+00:00'))
-            formatted_date = created_dt.strftime('%B %d, %Y')
-        except:
-            formatted_date = project.get('created_at', 'N/A')
-        customer_name = f"{project.get('customer_first_name', '')} {project.get('customer_last_name', '')}".strip()
-        overview_data = [
-            ['Project Details', 'Information'],
-            ['Project Name', project.get('name', 'N/A')],
-            ['Customer Name', customer_name or 'N/A'],
-            ['Street Address', address_components.get('street_address', 'N/A')],
-            ['City', address_components.get('city', 'N/A')],
-            ['State', address_components.get('region', 'N/A')],
-            ['ZIP Code', address_components.get('postal_code', 'N/A')],
-            ['Created Date', formatted_date],
-            ['Status', project.get('status', 'N/A').title()],
-            ['Property Type', project.get('project_type', 'N/A').title()]
-        ]
-        
-        return overview_data
+            if orjson:
+                key = orjson.dumps(project, option=orjson.OPT_SORT_KEYS)
+            else:
+                key = json.dumps(project, sort_keys=True)
+            rows = _cached_overview_rows(key)
+        except TypeError:
+            # Unserialisable payloads just skip the cache
+            rows = _format_overview_rows(project)
+
+        # Copy the rows so cached entries never leak to Table callers
+        return [['Project Details', 'Information']] + [row[:] for row in rows]
+
+    async def _fetch_design_data_async(self, design_id, project_id):
+        """Fetch the design/project responses and layout images concurrently."""
+        async with AuroraAPIAsync(self.api) as api:
+            design_summary, design_pricing, design_assets, project_data = await asyncio.gather(
+                api.get_design_summary(design_id),
+                api.get_design_pricing(design_id),
+                api.get_design_assets(design_id),
+                api.get_project(project_id) if project_id else _noop()
+            )
+
+            # Overlap the layout image downloads as well
+            urls = [
+                asset['url'] for asset in _layout_assets(design_assets)
+                if asset.get('url')
+            ]
+            buffers = await asyncio.gather(*(api.download_image(url) for url in urls))
+            image_cache = {url: buf for url, buf in zip(urls, buffers) if buf}
+
+        return design_summary, design_pricing, design_assets, project_data, image_cache
 
     def generate_design_report(self, design_id, project_id=None):
         """Generate a report for a specific design ID with improved image handling."""
@@ -362,21 +902,23 @@ class AuroraSolarReport:
                 self.logger.error("Failed to validate API credentials")
                 return False
 
-            # Fetch design-specific data
-            design_summary = self.api.get_design_summary(design_id)
+            # Fetch design-specific data; the four calls are independent, so
+            # issue them concurrently when aiohttp is available
+            image_cache = {}
+            if aiohttp is not None:
+                (design_summary, design_pricing, design_assets,
+                 project_data, image_cache) = asyncio.run(
+                    self._fetch_design_data_async(design_id, project_id))
+            else:
+                design_summary = self.api.get_design_summary(design_id)
+                design_pricing = self.api.get_design_pricing(design_id)
+                design_assets = self.api.get_design_assets(design_id)
+                project_data = self.api.get_project(project_id) if project_id else None
+
             if not design_summary:
                 self.logger.error("Failed to fetch design summary")
                 return False
 
-            design_pricing = self.api.get_design_pricing(design_id)
-            design_assets = self.api.get_design_assets(design_id)
-            
-            # Fetch project data if project_id is provided
-            # Fetch project data if project_id is provided
-            project_data = None
-            if project_id:
-                project_data = self.api.get_project(project_id)
-            
             # Create PDF generator
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"aurora_solar_report_design_{design_id}_{timestamp}.pdf"
@@ -403,34 +945,26 @@ class AuroraSolarReport:
             pdf.add_header("System Design Details")
             design_info = design_summary.get('design', {})
             materials = {item['component_type']: item for item in design_info.get('bill_of_materials', [])}
-            modules = materials.get('modules', {})
-            inverters = materials.get('microinverters', {})
-            system_size = design_info.get('system_size_stc', 0) / 1000
-            annual_production = design_info.get('energy_production', {}).get('annual', 0)
             arrays = design_info.get('arrays', [{}])
-            solar_access = arrays[0].get('shading', {}).get('solar_access', {}).get('annual', 0)
-            
-            design_data = [
-                ["Metric", "Value"],
-                ["System Size", f"{system_size:.2f} kW"],
-                ["Annual Production", f"{annual_production:,.0f} kWh"],
-                ["Number of Panels", str(modules.get('quantity', 'N/A'))],
-                ["Panel Model", modules.get('name', 'N/A')],
-                ["Inverter Model", inverters.get('name', 'N/A')],
-                ["Solar Access", f"{solar_access:.1f}%" if solar_access else "N/A"]
+            ctx = {
+                'modules': materials.get('modules', {}),
+                'inverters': materials.get('microinverters', {}),
+                'system_size': design_info.get('system_size_stc', 0) / 1000,
+                'annual_production': design_info.get('energy_production', {}).get('annual', 0),
+                'solar_access': arrays[0].get('shading', {}).get('solar_access', {}).get('annual', 0),
+            }
+
+            design_data = [["Metric", "Value"]] + [
+                [label, fmt(ctx)] for label, fmt in _DESIGN_FIELDS
             ]
             pdf.add_table(design_data)
-            
+
             # Add enhanced financial information
             if design_pricing:
                 pdf.add_header("Financial Overview")
-                price = design_pricing.get('system_price', 0)
-                financial_data = [
-                    ["Item", "Amount"],
-                    ["System Price", f"${price:,.2f}"],
-                    ["Price per Watt", f"${price/(system_size*1000):,.2f}/W" if system_size > 0 else "N/A"],
-                    ["Federal Tax Credit", f"${price*0.30:,.2f}"],
-                    ["Net System Cost", f"${price*0.70:,.2f}"]
+                ctx['price'] = design_pricing.get('system_price', 0)
+                financial_data = [["Item", "Amount"]] + [
+                    [label, fmt(ctx)] for label, fmt in _FINANCIAL_FIELDS
                 ]
                 pdf.add_table(financial_data)
             
@@ -442,48 +976,45 @@ class AuroraSolarReport:
                 images_added = False
                 
                 # Filter for CAD screenshots and layout images
-                layout_images = [
-                    asset for asset in design_assets['assets']
-                    if asset.get('type') in ['layout_image'] or asset.get('asset_type') == 'CAD Screenshot'
-                ]
+                layout_images = _layout_assets(design_assets)
                 
                 if not layout_images:
                     self.logger.warning("No layout images or CAD screenshots found in design assets")
                     pdf.add_paragraph("System design images are currently unavailable.")
                 else:
+                    # Download whatever the async prefetch didn't supply in
+                    # parallel; workers share the session's connection pool and
+                    # its Retry policy handles transient failures with backoff
+                    urls = [asset['url'] for asset in layout_images if asset.get('url')]
+                    # Dedupe: assets can share a URL
+                    missing = list(dict.fromkeys(
+                        url for url in urls if url not in image_cache))
+                    if missing:
+                        with ThreadPoolExecutor(max_workers=min(8, len(missing))) as executor:
+                            for url, buf in zip(missing, executor.map(self.api.download_image, missing)):
+                                if buf:
+                                    image_cache[url] = buf
+
+                    # Add images in the original asset order
                     for asset in layout_images:
                         self.logger.info(f"Processing image: {asset.get('type') or asset.get('asset_type')}")
-                        
-                        # Get the URL from the asset
+
                         image_url = asset.get('url')
                         if not image_url:
                             continue
-                            
-                        # Download image with retries
-                        max_retries = 3
-                        for attempt in range(max_retries):
-                            try:
-                                self.logger.info(f"Download attempt {attempt + 1} for image")
-                                image_data = self.api.download_image(image_url)
-                                
-                                if image_data:
-                                    if pdf.add_image(image_data):
-                                        images_added = True
-                                        self.logger.info("Successfully added image to PDF")
-                                        break
-                                    else:
-                                        self.logger.error("Failed to add image to PDF")
-                                
-                                if attempt < max_retries - 1:
-                                    self.logger.info("Waiting before retry...")
-                                    time.sleep(2)  # Increased wait time between retries
-                                    
-                            except Exception as e:
-                                self.logger.error(f"Error processing image: {str(e)}")
-                                if attempt < max_retries - 1:
-                                    continue
-                                break
-                    
+
+                        try:
+                            # .get, not .pop: assets can share a URL, and
+                            # add_image re-seeks the buffer before reading
+                            image_data = image_cache.get(image_url)
+                            if image_data and pdf.add_image(image_data):
+                                images_added = True
+                                self.logger.info("Successfully added image to PDF")
+                            else:
+                                self.logger.error("Failed to add image to PDF")
+                        except Exception as e:
+                            self.logger.error(f"Error processing image: {str(e)}")
+
                     if not images_added:
                         self.logger.warning("Failed to add any images to the PDF")
                         pdf.add_paragraph("System design images are currently unavailable.")
@@ -1,7 +1,12 @@
 from aurora_pdf_generator import AuroraAPI
-import json 
+import json
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def print_api_responses(api_key, tenant_id, design_id, project_id, output_file=None):
     api = AuroraAPI(api_key, tenant_id)
     
@@ -15,7 +20,10 @@ def print_api_responses(api_key, tenant_id, design_id, project_id, output_file=N
         "Project Data": api.get_project(project_id)
     }
     
-    json_output = json.dumps(responses, indent=2)
+    if orjson:
+        json_output = orjson.dumps(responses, option=orjson.OPT_INDENT_2).decode()
+    else:
+        json_output = json.dumps(responses, indent=2)
     
     if output_file:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")